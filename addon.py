@@ -6,6 +6,7 @@ import mathutils
 import json
 import threading
 import socket
+import struct
 import time
 import requests
 import tempfile
@@ -23,7 +24,7 @@ from contextlib import redirect_stdout, suppress
 bl_info = {
     "name": "Blender MCP",
     "author": "BlenderMCP",
-    "version": (1, 2),
+    "version": (1, 3),
     "blender": (3, 0, 0),
     "location": "View3D > Sidebar > BlenderMCP",
     "description": "Connect Blender to Claude via MCP",
@@ -36,6 +37,12 @@ RODIN_FREE_TRIAL_KEY = "k9TcfFoEhNd9cCPP2guHAHHHkctZHIRhZDywZ1euGUXwihbYLpOjQhof
 REQ_HEADERS = requests.utils.default_headers()
 REQ_HEADERS.update({"User-Agent": "blender-mcp"})
 
+# Every message on the MCP socket is a 4-byte big-endian payload length followed by UTF-8 JSON
+FRAME_HEADER = struct.Struct(">I")
+
+# Top-level sections of get_scene_info, in output order
+SCENE_INFO_SECTIONS = ("scene", "selection", "objects", "materials", "world", "collections")
+
 class BlenderMCPServer:
     def __init__(self, host='localhost', port=9876):
         self.host = host
@@ -56,7 +63,7 @@ class BlenderMCPServer:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
+            self.socket.listen(5)
 
             # Start server thread
             self.server_thread = threading.Thread(target=self._server_loop)
@@ -100,6 +107,8 @@ class BlenderMCPServer:
                 # Accept new connection
                 try:
                     client, address = self.socket.accept()
+                    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    client.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
                     print(f"Connected to client: {address}")
 
                     # Handle client in a separate thread
@@ -127,7 +136,7 @@ class BlenderMCPServer:
         """Handle connected client"""
         print("Client handler started")
         client.settimeout(None)  # No timeout
-        buffer = b''
+        buffer = bytearray()
 
         try:
             while self.running:
@@ -139,38 +148,28 @@ class BlenderMCPServer:
                         break
 
                     buffer += data
-                    try:
-                        # Try to parse command
-                        command = json.loads(buffer.decode('utf-8'))
-                        buffer = b''
 
-                        # Execute command in Blender's main thread
-                        def execute_wrapper():
-                            try:
-                                response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode('utf-8'))
-                                except:
-                                    print("Failed to send response - client disconnected")
-                            except Exception as e:
-                                print(f"Error executing command: {str(e)}")
-                                traceback.print_exc()
-                                try:
-                                    error_response = {
-                                        "status": "error",
-                                        "message": str(e)
-                                    }
-                                    client.sendall(json.dumps(error_response).encode('utf-8'))
-                                except:
-                                    pass
-                            return None
-
-                        # Schedule execution in main thread
-                        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
-                    except json.JSONDecodeError:
-                        # Incomplete data, wait for more
-                        pass
+                    # Dispatch every complete frame we have buffered
+                    while len(buffer) >= FRAME_HEADER.size:
+                        (length,) = FRAME_HEADER.unpack_from(buffer)
+                        end = FRAME_HEADER.size + length
+                        if len(buffer) < end:
+                            # Incomplete frame, wait for more
+                            break
+
+                        payload = bytes(buffer[FRAME_HEADER.size:end])
+                        del buffer[:end]
+
+                        try:
+                            command = json.loads(payload)
+                        except json.JSONDecodeError as e:
+                            self._send_response(client, {
+                                "status": "error",
+                                "message": f"Invalid JSON command: {str(e)}"
+                            })
+                            continue
+
+                        self._schedule_command(client, command)
                 except Exception as e:
                     print(f"Error receiving data: {str(e)}")
                     break
@@ -183,6 +182,35 @@ class BlenderMCPServer:
                 pass
             print("Client handler stopped")
 
+    def _send_response(self, client, response):
+        """Send a length-prefixed JSON response to the client"""
+        payload = json.dumps(response).encode('utf-8')
+        client.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+    def _schedule_command(self, client, command):
+        """Execute a command in Blender's main thread and send back the response"""
+        def execute_wrapper():
+            try:
+                response = self.execute_command(command)
+                try:
+                    self._send_response(client, response)
+                except:
+                    print("Failed to send response - client disconnected")
+            except Exception as e:
+                print(f"Error executing command: {str(e)}")
+                traceback.print_exc()
+                try:
+                    self._send_response(client, {
+                        "status": "error",
+                        "message": str(e)
+                    })
+                except:
+                    pass
+            return None
+
+        # Schedule execution in main thread
+        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
+
     def execute_command(self, command):
         """Execute a command in the main Blender thread"""
         try:
@@ -266,14 +294,18 @@ class BlenderMCPServer:
 
 
 
-    def get_scene_info(self):
-        """Get comprehensive information about the current Blender scene"""
+    def get_scene_info(self, sections=None):
+        """Get comprehensive information about the current Blender scene
+
+        sections optionally limits the result to a subset of SCENE_INFO_SECTIONS,
+        so callers only pay for the parts they need.
+        """
         try:
             print("Getting scene info...")
             scene = bpy.context.scene
 
-            scene_info = {
-                "scene": {
+            builders = {
+                "scene": lambda: {
                     "name": scene.name,
                     "frame_current": scene.frame_current,
                     "frame_start": scene.frame_start,
@@ -282,18 +314,26 @@ class BlenderMCPServer:
                     "active_camera": scene.camera.name if scene.camera else None,
                     "mode": bpy.context.mode
                 },
-                "selection": {
+                "selection": lambda: {
                     "active_object": bpy.context.active_object.name if bpy.context.active_object else None,
                     "selected_objects": [obj.name for obj in bpy.context.selected_objects],
                     "total_selected": len(bpy.context.selected_objects)
                 },
-                "objects": self._get_all_objects(),
-                "materials": self._get_materials(),
-                "world": self._get_world_settings(),
-                "collections": self._get_collections()
+                "objects": self._get_all_objects,
+                "materials": self._get_materials,
+                "world": self._get_world_settings,
+                "collections": self._get_collections
             }
+            if sections:
+                unknown = set(sections) - builders.keys()
+                if unknown:
+                    raise ValueError(f"Unknown scene info sections: {', '.join(sorted(unknown))}")
+            else:
+                sections = SCENE_INFO_SECTIONS
 
-            print(f"Scene info collected: {len(scene_info['objects'])} objects, {len(scene_info['materials'])} materials")
+            scene_info = {name: builders[name]() for name in SCENE_INFO_SECTIONS if name in sections}
+
+            print(f"Scene info collected: {', '.join(scene_info)}")
             return scene_info
         except Exception as e:
             print(f"Error in get_scene_info: {str(e)}")
@@ -438,18 +478,21 @@ class BlenderMCPServer:
 
     def get_viewport_screenshot(self, max_size=800, filepath=None, format="png"):
         """
-        Capture a screenshot of the current 3D viewport and save it to the specified path.
+        Capture a screenshot of the current 3D viewport.
 
         Parameters:
         - max_size: Maximum size in pixels for the largest dimension of the image
-        - filepath: Path where to save the screenshot file
+        - filepath: Optional path where to save the screenshot file. If omitted, the image
+          is returned inline as base64 under "image_b64" and no file is left behind
         - format: Image format (png, jpg, etc.)
 
         Returns success/error status
         """
+        inline = not filepath
         try:
-            if not filepath:
-                return {"error": "No filepath provided"}
+            if inline:
+                fd, filepath = tempfile.mkstemp(prefix="blender_screenshot_", suffix=f".{format}")
+                os.close(fd)
 
             # Find the active 3D viewport
             area = None
@@ -483,15 +526,24 @@ class BlenderMCPServer:
             # Cleanup Blender image data
             bpy.data.images.remove(img)
 
-            return {
+            result = {
                 "success": True,
                 "width": width,
                 "height": height,
-                "filepath": filepath
             }
+            if inline:
+                with open(filepath, 'rb') as f:
+                    result["image_b64"] = base64.b64encode(f.read()).decode('ascii')
+            else:
+                result["filepath"] = filepath
+            return result
 
         except Exception as e:
             return {"error": str(e)}
+        finally:
+            if inline and filepath:
+                with suppress(OSError):
+                    os.remove(filepath)
 
     def execute_code(self, code):
         """Execute arbitrary Blender Python code"""
@@ -27,8 +27,11 @@ hiddenimports += [
     'typing',
     'pathlib',
     'base64',
+    'mmap',
     'urllib.parse',
     'supabase',
+    'orjson',
+    'pybase64',
     'tomli',
 ]
 
@@ -65,12 +65,13 @@ Write-Host ""
 Write-Host "[5/6] Creating ZIP package..." -ForegroundColor Yellow
 $zipName = "blender-mcp-v$Version-$Platform.zip"
 $filesToZip = @(
-    "dist\blender-mcp.exe",
     "dist\blender_mcp_addon.py",
     "dist\manifest.json"
 )
 
-Compress-Archive -Path $filesToZip -DestinationPath "dist\$zipName" -Force
+# The exe is already UPX-compressed, so store it as-is and only deflate the text files
+Compress-Archive -Path "dist\blender-mcp.exe" -DestinationPath "dist\$zipName" -CompressionLevel NoCompression -Force
+Compress-Archive -Path $filesToZip -DestinationPath "dist\$zipName" -CompressionLevel Optimal -Update
 Write-Host "   ✓ Created dist\$zipName" -ForegroundColor Green
 
 # Get file size
@@ -43,7 +43,8 @@ Write-Host "   Done" -ForegroundColor Green
 # Step 5: Create ZIP
 Write-Host "[5/6] Creating ZIP..." -ForegroundColor Yellow
 $zipName = "blender-mcp-v$Version-$Platform.zip"
-Compress-Archive -Path @("dist\blender-mcp.exe", "dist\blender_mcp_addon.py", "dist\manifest.json") -DestinationPath "dist\$zipName" -Force
+Compress-Archive -Path "dist\blender-mcp.exe" -DestinationPath "dist\$zipName" -CompressionLevel NoCompression -Force
+Compress-Archive -Path @("dist\blender_mcp_addon.py", "dist\manifest.json") -DestinationPath "dist\$zipName" -CompressionLevel Optimal -Update
 $zipSize = (Get-Item "dist\$zipName").Length
 Write-Host "   Done - Size: $zipSize bytes" -ForegroundColor Green
 
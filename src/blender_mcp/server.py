@@ -1,17 +1,34 @@
 # blender_mcp_server.py
 from mcp.server.fastmcp import FastMCP, Context, Image
 import socket
+import struct
 import json
 import asyncio
+import functools
+import hashlib
 import logging
-import tempfile
+import mmap
+import time
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Any, List
 import os
-from pathlib import Path
+import re
 import base64
-from urllib.parse import urlparse
+from operator import itemgetter
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pybase64
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
 
 # Import telemetry
 from .telemetry import record_startup, get_telemetry
@@ -22,138 +39,247 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("BlenderMCPServer")
 
+# Tool results are compact JSON unless BLENDER_MCP_PRETTY=1 asks for indented output
+PRETTY_JSON = os.getenv("BLENDER_MCP_PRETTY") == "1"
+
+# JSON helpers, backed by orjson when it is installed; encoders are bound once at import
+if HAS_ORJSON:
+    def _loads(data: bytes) -> Any:
+        """Parse JSON, falling back to the json module for input orjson rejects"""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The addon encodes with the json module, which can emit NaN and Infinity
+            return json.loads(data)
+
+    _dumps_bytes = orjson.dumps
+    _RESULT_OPTIONS = orjson.OPT_INDENT_2 if PRETTY_JSON else None
+
+    def _dumps_result(obj: Any) -> str:
+        """Serialize a tool result as JSON text"""
+        return _dumps_bytes(obj, option=_RESULT_OPTIONS).decode()
+else:
+    _loads = json.loads
+    _encode_json = json.JSONEncoder().encode
+    # json.dumps builds a new JSONEncoder on every call that passes formatting options
+    _dumps_result = (
+        json.JSONEncoder(indent=2) if PRETTY_JSON else json.JSONEncoder(separators=(",", ":"))
+    ).encode
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        """Serialize obj as UTF-8 encoded JSON"""
+        return _encode_json(obj).encode('utf-8')
+
+# Base64 helper, backed by pybase64's SIMD codec when it is installed
+if HAS_PYBASE64:
+    def _b64encode(data: bytes) -> str:
+        """Base64-encode data to ASCII text"""
+        return pybase64.b64encode_as_string(data)
+else:
+    def _b64encode(data: bytes) -> str:
+        """Base64-encode data to ASCII text"""
+        return base64.b64encode(data).decode("ascii")
+
 # Default configuration
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
 
+# Connection target, read from the environment once at import
+BLENDER_HOST = os.getenv("BLENDER_HOST", DEFAULT_HOST)
+BLENDER_PORT = int(os.getenv("BLENDER_PORT", DEFAULT_PORT))
+
+# Every message on the Blender socket is a 4-byte big-endian payload length followed by UTF-8 JSON
+FRAME_HEADER = struct.Struct(">I")
+
+def _encode_frame(command: Dict[str, Any]) -> bytes:
+    """Encode a command as a length-prefixed JSON frame"""
+    payload = _dumps_bytes(command)
+    return FRAME_HEADER.pack(len(payload)) + payload
+
+# Commands that never take parameters are encoded once at import
+_FIXED_COMMAND_FRAMES = {
+    name: _encode_frame({"type": name, "params": {}})
+    for name in (
+        "get_scene_info",
+        "get_polyhaven_status",
+        "get_hyper3d_status",
+        "get_sketchfab_status",
+        "get_hunyuan3d_status",
+    )
+}
+
+# Kernel socket buffer size, large enough for scene dumps and screenshots
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Number of Blender connections kept open so independent tool calls can run concurrently
+DEFAULT_POOL_SIZE = 4
+
+# How long the PolyHaven status is trusted before get_blender_connection asks Blender again
+POLYHAVEN_STATUS_TTL = 30.0
+
+# How long the first status check may take; an addon from before length-prefixed framing never answers it
+HANDSHAKE_TIMEOUT = 10.0
+
+# Top-level sections the addon can return from get_scene_info
+SCENE_INFO_SECTIONS = frozenset({"scene", "selection", "objects", "materials", "world", "collections"})
+
+# How long a scene read is reused; edits made by hand in Blender are only picked up after this
+SCENE_CACHE_TTL = 2.0
+
+# Upper bound on threads used to read and encode Hyper3D input images
+MAX_IMAGE_LOAD_WORKERS = 8
+_image_executor = ThreadPoolExecutor(max_workers=MAX_IMAGE_LOAD_WORKERS, thread_name_prefix="blender-mcp-image")
+
+# How long an identical generation request reuses the job it already created ("recently" in the tool docstrings)
+JOB_SUBMISSION_TTL = 300.0
+
+# Accepts http(s) URLs with a non-empty host, one per line
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE | re.MULTILINE)
+
 @dataclass
 class BlenderConnection:
     host: str
     port: int
     sock: socket.socket = None  # Changed from 'socket' to 'sock' to avoid naming conflict
-    
-    def connect(self) -> bool:
+    reader: asyncio.StreamReader = None
+    writer: asyncio.StreamWriter = None
+
+    async def connect(self) -> bool:
         """Connect to the Blender addon socket server"""
-        if self.sock:
+        if self.writer:
             return True
-            
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.connect((self.host, self.port))
+            # Size the buffers before connecting so the TCP window scale is negotiated for them
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setblocking(False)
+            loop = asyncio.get_running_loop()
+            # Resolve first, the Proactor loop on Windows only connects to numeric addresses
+            addrinfo = await loop.getaddrinfo(self.host, self.port, family=socket.AF_INET, type=socket.SOCK_STREAM)
+            await loop.sock_connect(sock, addrinfo[0][4])
+            # Commands are small request/response RPCs, so don't let Nagle or delayed ACKs hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self._tune_keepalive(sock)
+            self._enable_quickack(sock)
+            self.reader, self.writer = await asyncio.open_connection(sock=sock, limit=SOCKET_BUFFER_SIZE)
+            self.sock = sock
             logger.info(f"Connected to Blender at {self.host}:{self.port}")
             return True
         except Exception as e:
             logger.error(f"Failed to connect to Blender: {str(e)}")
-            self.sock = None
+            sock.close()
             return False
-    
+
     def disconnect(self):
         """Disconnect from the Blender addon"""
-        if self.sock:
+        if self.writer:
             try:
-                self.sock.close()
+                self.writer.close()
             except Exception as e:
                 logger.error(f"Error disconnecting from Blender: {str(e)}")
             finally:
                 self.sock = None
+                self.reader = None
+                self.writer = None
 
-    def receive_full_response(self, sock, buffer_size=8192):
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        # Use a consistent timeout value that matches the addon's timeout
-        sock.settimeout(180.0)  # Match the addon's timeout
-        
+    def is_alive(self) -> bool:
+        """Check the connection locally, without sending anything to Blender"""
+        # The transport has seen EOF or a reset if Blender closed the socket while it sat idle
+        if self.writer is None or self.writer.is_closing() or self.reader.at_eof():
+            return False
         try:
-            while True:
-                try:
-                    chunk = sock.recv(buffer_size)
-                    if not chunk:
-                        # If we get an empty chunk, the connection might be closed
-                        if not chunks:  # If we haven't received anything yet, this is an error
-                            raise Exception("Connection closed before receiving any data")
-                        break
-                    
-                    chunks.append(chunk)
-                    
-                    # Check if we've received a complete JSON object
-                    try:
-                        data = b''.join(chunks)
-                        json.loads(data.decode('utf-8'))
-                        # If we get here, it parsed successfully
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
-                        continue
-                except socket.timeout:
-                    # If we hit a timeout during receiving, break the loop and try to use what we have
-                    logger.warning("Socket timeout during chunked receive")
-                    break
-                except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
-                    logger.error(f"Socket connection error during receive: {str(e)}")
-                    raise  # Re-raise to be handled by the caller
-        except socket.timeout:
-            logger.warning("Socket timeout during chunked receive")
-        except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
-            raise
-            
-        # If we get here, we either timed out or broke out of the loop
-        # Try to use what we have
-        if chunks:
-            data = b''.join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
+            if self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                return False
+            # The socket is non-blocking under asyncio, so an idle peer raises BlockingIOError here
+            return self.sock.recv(1, socket.MSG_PEEK) != b""
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _tune_keepalive(sock):
+        """Let the kernel notice a dead Blender within about a minute instead of hours"""
+        for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+            option = getattr(socket, name, None)
+            if option is None:
+                continue
             try:
-                # Try to parse what we have
-                json.loads(data.decode('utf-8'))
-                return data
-            except json.JSONDecodeError:
-                # If we can't parse it, it's incomplete
-                raise Exception("Incomplete JSON response received")
-        else:
-            raise Exception("No data received")
+                sock.setsockopt(socket.IPPROTO_TCP, option, value)
+            except OSError:
+                # Only a tuning hint, the connection works without it
+                pass
+
+    @staticmethod
+    def _enable_quickack(sock):
+        """Ask the kernel to ACK immediately (Linux only, and it resets after each ACK)"""
+        if hasattr(socket, "TCP_QUICKACK"):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except OSError:
+                # It's only a latency hint, some platforms reject it
+                pass
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def _read_exactly(self, count: int) -> bytes:
+        """Read exactly count bytes from Blender"""
+        try:
+            data = await self.reader.readexactly(count)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Connection closed by Blender")
+        self._enable_quickack(self.sock)
+        return data
+
+    async def receive_full_response(self) -> bytes:
+        """Receive one complete length-prefixed response frame"""
+        (length,) = FRAME_HEADER.unpack(await self._read_exactly(FRAME_HEADER.size))
+        return await self._read_exactly(length)
+
+    async def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: float = 180.0) -> Dict[str, Any]:
         """Send a command to Blender and return the response"""
-        if not self.sock and not self.connect():
+        if not self.writer and not await self.connect():
             raise ConnectionError("Not connected to Blender")
         
-        command = {
-            "type": command_type,
-            "params": params or {}
-        }
-        
         try:
-            # Log the command being sent
-            logger.info(f"Sending command: {command_type} with params: {params}")
-            
-            # Send the command
-            self.sock.sendall(json.dumps(command).encode('utf-8'))
-            logger.info(f"Command sent, waiting for response...")
+            # Per-command logging is DEBUG with lazy %-formatting, params can hold whole base64 images
+            logger.debug("Sending command: %s with params: %s", command_type, params)
             
-            # Set a timeout for receiving - use the same timeout as in receive_full_response
-            self.sock.settimeout(180.0)  # Match the addon's timeout
+            # Send the command as a single length-prefixed frame
+            frame = None if params else _FIXED_COMMAND_FRAMES.get(command_type)
+            if frame is None:
+                frame = _encode_frame({
+                    "type": command_type,
+                    "params": params or {}
+                })
+            self.writer.write(frame)
+            await self.writer.drain()
+            logger.debug("Command sent, waiting for response...")
             
-            # Receive the response using the improved receive_full_response method
-            response_data = self.receive_full_response(self.sock)
-            logger.info(f"Received {len(response_data)} bytes of data")
+            # The default timeout matches the addon's timeout
+            response_data = await asyncio.wait_for(self.receive_full_response(), timeout=timeout)
+            logger.debug("Received %d bytes of data", len(response_data))
             
-            response = json.loads(response_data.decode('utf-8'))
-            logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
+            response = _loads(response_data)
+            logger.debug("Response parsed, status: %s", response.get('status', 'unknown'))
 
             # Return the full response (including errors) without raising
             # Let the calling tool handle error formatting
             return response
-        except socket.timeout:
+        except asyncio.TimeoutError:
             logger.error("Socket timeout while waiting for response from Blender")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            # Just invalidate the current socket so it will be recreated next time
-            self.sock = None
-            raise Exception("Timeout waiting for Blender response - try simplifying your request")
+            # Drop the socket, a late response would otherwise be read as the answer to the next command
+            self.disconnect()
+            raise TimeoutError("Timeout waiting for Blender response - try simplifying your request")
+        except asyncio.CancelledError:
+            # Same as a timeout, the response to this command may still arrive
+            self.disconnect()
+            raise
         except (ConnectionError, BrokenPipeError, ConnectionResetError) as e:
             logger.error(f"Socket connection error: {str(e)}")
-            self.sock = None
-            raise Exception(f"Connection to Blender lost: {str(e)}")
+            self.disconnect()
+            raise ConnectionError(f"Connection to Blender lost: {str(e)}")
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON response from Blender: {str(e)}")
             # Try to log what was received
@@ -162,14 +288,47 @@ class BlenderConnection:
             raise Exception(f"Invalid response from Blender: {str(e)}")
         except Exception as e:
             logger.error(f"Error communicating with Blender: {str(e)}")
-            # Don't try to reconnect here - let the get_blender_connection handle reconnection
-            self.sock = None
+            # Don't try to reconnect here - the pool reconnects on the next acquire
+            self.disconnect()
             raise Exception(f"Communication error with Blender: {str(e)}")
 
+class BlenderConnectionPool:
+    """A bounded pool of persistent Blender connections"""
+
+    def __init__(self, host: str, port: int, max_size: int = DEFAULT_POOL_SIZE):
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self._idle: List[BlenderConnection] = []
+        self._slots = asyncio.Semaphore(max_size)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[BlenderConnection]:
+        """Borrow a connected BlenderConnection, waiting if all of them are busy"""
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else BlenderConnection(host=self.host, port=self.port)
+            if conn.writer is not None and not conn.is_alive():
+                logger.warning("Pooled connection to Blender was closed, reconnecting")
+                conn.disconnect()
+            if not await conn.connect():
+                raise ConnectionError("Could not connect to Blender. Make sure the Blender addon is running.")
+            try:
+                yield conn
+            finally:
+                # send_command drops broken sockets, only keep the ones that are still open
+                if conn.writer is not None:
+                    self._idle.append(conn)
+
+    def close(self):
+        """Disconnect all idle connections"""
+        for conn in self._idle:
+            conn.disconnect()
+        self._idle.clear()
+
 @asynccontextmanager
 async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     """Manage server startup and shutdown lifecycle"""
-    # We don't need to create a connection here since we're using the global connection
+    # We don't need to create a connection here since we're using the global connection pool
     # for resources and tools
 
     try:
@@ -184,22 +343,22 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
 
         # Try to connect to Blender on startup to verify it's available
         try:
-            # This will initialize the global connection if needed
-            blender = get_blender_connection()
-            logger.info("Successfully connected to Blender on startup")
+            # This will initialize the global pool if needed
+            async with get_blender_connection():
+                logger.info("Successfully connected to Blender on startup")
         except Exception as e:
             logger.warning(f"Could not connect to Blender on startup: {str(e)}")
             logger.warning("Make sure the Blender addon is running before using Blender resources or tools")
 
-        # Return an empty context - we're using the global connection
+        # Return an empty context - we're using the global connection pool
         yield {}
     finally:
-        # Clean up the global connection on shutdown
-        global _blender_connection
-        if _blender_connection:
+        # Clean up the global pool on shutdown
+        global _blender_pool
+        if _blender_pool:
             logger.info("Disconnecting from Blender on shutdown")
-            _blender_connection.disconnect()
-            _blender_connection = None
+            _blender_pool.close()
+            _blender_pool = None
         logger.info("BlenderMCP server shut down")
 
 # Create the MCP server with lifespan support
@@ -208,90 +367,231 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
+# Polyhaven asset "type" codes, as returned by the Polyhaven API
+_POLYHAVEN_TYPE_LABELS = {0: "HDRI", 1: "Texture", 2: "Model"}
+
+# Polyhaven asset_type values accepted by the addon, checked here to save a round-trip on bad input
+_POLYHAVEN_ASSET_TYPES = frozenset({"hdris", "textures", "models"})
+_POLYHAVEN_QUERY_TYPES = _POLYHAVEN_ASSET_TYPES | {"all"}
+
 # Resource endpoints
 
-# Global connection for resources (since resources can't access context)
-_blender_connection = None
+# Global connection pool for resources (since resources can't access context)
+_blender_pool = None
 _polyhaven_enabled = False  # Add this global variable
+_polyhaven_status_ts = 0.0  # time.monotonic() of the last PolyHaven status refresh
 
-def get_blender_connection():
-    """Get or create a persistent Blender connection"""
-    global _blender_connection, _polyhaven_enabled  # Add _polyhaven_enabled to globals
-    
-    # If we have an existing connection, check if it's still valid
-    if _blender_connection is not None:
-        try:
-            # First check if PolyHaven is enabled by sending a ping command
-            result = _blender_connection.send_command("get_polyhaven_status")
-            # Store the PolyHaven status globally
-            _polyhaven_enabled = result.get("enabled", False)
-            return _blender_connection
-        except Exception as e:
-            # Connection is dead, close it and create a new one
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
+def _store_polyhaven_status(result: Dict[str, Any]):
+    """Remember the PolyHaven status from a get_polyhaven_status result"""
+    global _polyhaven_enabled, _polyhaven_status_ts
+    _polyhaven_enabled = result.get("enabled", False)
+    _polyhaven_status_ts = time.monotonic()
+
+@asynccontextmanager
+async def get_blender_connection() -> AsyncIterator[BlenderConnection]:
+    """Borrow a persistent Blender connection from the global pool"""
+    global _blender_pool
+
+    if _blender_pool is None:
+        _blender_pool = BlenderConnectionPool(host=BLENDER_HOST, port=BLENDER_PORT)
+
+    async with _blender_pool.acquire() as blender:
+        # Refresh the cached PolyHaven status only once it has gone stale, instead of on every call
+        if time.monotonic() - _polyhaven_status_ts > POLYHAVEN_STATUS_TTL:
+            first_check = _polyhaven_status_ts == 0.0
             try:
-                _blender_connection.disconnect()
-            except:
-                pass
-            _blender_connection = None
-    
-    # Create a new connection if needed
-    if _blender_connection is None:
-        host = os.getenv("BLENDER_HOST", DEFAULT_HOST)
-        port = int(os.getenv("BLENDER_PORT", DEFAULT_PORT))
-        _blender_connection = BlenderConnection(host=host, port=port)
-        if not _blender_connection.connect():
-            logger.error("Failed to connect to Blender")
-            _blender_connection = None
-            raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
-        logger.info("Created new persistent connection to Blender")
-    
-    return _blender_connection
+                response = await blender.send_command(
+                    "get_polyhaven_status", timeout=HANDSHAKE_TIMEOUT if first_check else 180.0
+                )
+                # Store the PolyHaven status globally
+                _store_polyhaven_status(response.get("result", {}))
+            except Exception as e:
+                if first_check and isinstance(e, (ConnectionError, TimeoutError)):
+                    # Fail fast instead of letting every tool wait for the full timeout
+                    raise ConnectionError(
+                        "Blender did not answer the initial status check. If you recently upgraded blender-mcp, "
+                        "reinstall addon.py from the same release, older addons use an incompatible protocol."
+                    ) from e
+                # Connection is dead, send_command already dropped it so open a new one
+                logger.warning(f"Existing connection is no longer valid: {str(e)}")
+                if not await blender.connect():
+                    logger.error("Failed to connect to Blender")
+                    raise ConnectionError("Could not connect to Blender. Make sure the Blender addon is running.")
+                logger.info("Created new persistent connection to Blender")
+
+        yield blender
+
+class BlenderError(Exception):
+    """Raised when Blender reports that a command failed"""
+
+def _unwrap(response: Dict[str, Any]) -> Any:
+    """Return the result from a Blender response envelope, raising BlenderError if the command failed"""
+    # Successful responses always carry "result" and error responses never do,
+    # so the common path is a single lookup
+    try:
+        return response["result"]
+    except KeyError:
+        raise BlenderError(response.get("message", "Unknown error")) from None
+
+def _tool_error_handler(label: str):
+    """Decorator that logs a tool's exceptions and returns them as an error message"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except (BlenderError, ConnectionError, TimeoutError) as e:
+                # Expected failures (Blender not running, or reporting an error), no traceback needed
+                logger.error(f"Error {label}: {str(e)}")
+                return f"Error {label}: {str(e)}"
+            except Exception as e:
+                logger.exception(f"Error {label}: {str(e)}")
+                return f"Error {label}: {str(e)}"
+        return wrapper
+    return decorator
+
+
+# Commands that never change the Blender scene; any other command invalidates cached scene reads
+_NON_MUTATING_COMMANDS = frozenset({
+    "get_scene_info",
+    "get_object_info",
+    "get_viewport_screenshot",
+    "get_polyhaven_status",
+    "get_hyper3d_status",
+    "get_sketchfab_status",
+    "get_hunyuan3d_status",
+    "get_polyhaven_categories",
+    "search_polyhaven_assets",
+    "search_sketchfab_models",
+    "poll_rodin_job_status",
+    "poll_hunyuan_job_status",
+})
+
+# Successful scene reads keyed by command and parameters, valid while _scene_generation is unchanged
+_scene_cache: Dict[tuple, tuple[int, float, Dict[str, Any]]] = {}
+_scene_generation = 0
+
+def _invalidate_scene_cache():
+    """Start a new scene generation, dropping all cached scene reads"""
+    global _scene_generation
+    _scene_generation += 1
+    # Entries from older generations can never be served again
+    _scene_cache.clear()
+
+async def send_blender_command(command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Send a single command to Blender over a pooled connection"""
+    if command_type in _NON_MUTATING_COMMANDS:
+        async with get_blender_connection() as blender:
+            return await blender.send_command(command_type, params)
+    _invalidate_scene_cache()
+    try:
+        async with get_blender_connection() as blender:
+            return await blender.send_command(command_type, params)
+    finally:
+        # Invalidate again once the edit is done, a read that overlapped it may have seen the old scene
+        _invalidate_scene_cache()
+
+async def send_scene_read(command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Send a scene read command, reusing a recent identical response if nothing has changed the scene since"""
+    key = (command_type, _dumps_bytes(params) if params else b"")
+    generation = _scene_generation
+    cached = _scene_cache.get(key)
+    if cached is not None and cached[0] == generation and time.monotonic() - cached[1] < SCENE_CACHE_TTL:
+        return cached[2]
+
+    response = await send_blender_command(command_type, params)
+    # Only keep the response if no mutating command was sent or finished while it was in flight
+    if "result" in response and _scene_generation == generation:
+        _scene_cache[key] = (generation, time.monotonic(), response)
+    return response
+
+# Poll commands currently waiting on Blender, keyed by command type and parameters
+_inflight_polls: Dict[tuple, asyncio.Future] = {}
+
+async def send_coalesced_poll(command_type: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a read-only poll command, sharing the round-trip with an identical poll already in flight"""
+    key = (command_type, tuple(sorted(params.items())))
+    task = _inflight_polls.get(key)
+    if task is None:
+        task = asyncio.ensure_future(send_blender_command(command_type, params))
+        _inflight_polls[key] = task
+        task.add_done_callback(lambda _: _inflight_polls.pop(key, None))
+    # Shield the shared task so one cancelled caller doesn't cancel it for the others
+    return await asyncio.shield(task)
+
+# Recently submitted generation jobs, keyed by a hash of the creation command, so retries reuse the job
+_submitted_jobs: Dict[bytes, tuple[float, Any]] = {}
+
+async def submit_generation_job(
+    command_type: str,
+    params: Dict[str, Any],
+    extract_job: Callable[[Dict[str, Any]], Any],
+    force_new: bool = False,
+) -> Any:
+    """Create a generation job, returning the job from an identical submission made within JOB_SUBMISSION_TTL
+    unless force_new is set"""
+    key = hashlib.blake2b(command_type.encode() + _dumps_bytes(params)).digest()
+    now = time.monotonic()
+    # Drop expired entries so the cache stays small
+    for stale in [k for k, (ts, _) in _submitted_jobs.items() if now - ts >= JOB_SUBMISSION_TTL]:
+        del _submitted_jobs[stale]
+    cached = _submitted_jobs.get(key)
+    if cached is not None and not force_new:
+        logger.info(f"Reusing recently submitted {command_type} job")
+        return cached[1]
+
+    result = _unwrap(await send_blender_command(command_type, params))
+    job = extract_job(result)
+    if job is None:
+        return result
+
+    _submitted_jobs[key] = (time.monotonic(), job)
+    return job
+
+def forget_generation_job(field: str, value: str):
+    """Stop reusing the submitted job whose id field matches value, so the next identical request creates a new one"""
+    for stale in [k for k, (_, job) in _submitted_jobs.items() if job.get(field) == value]:
+        del _submitted_jobs[stale]
 
 
 @telemetry_tool("get_scene_info")
 @mcp.tool()
-def get_scene_info(ctx: Context) -> str:
-    """Get detailed information about the current Blender scene"""
-    try:
-        blender = get_blender_connection()
-        response = blender.send_command("get_scene_info")
-
-        # Check for errors
-        if response.get("status") == "error":
-            error_msg = response.get("message", "Unknown error")
-            logger.error(f"Blender error: {error_msg}")
-            return f"Error getting scene info: {error_msg}"
-
-        # Return the result
-        result = response.get("result", {})
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting scene info from Blender: {str(e)}")
-        return f"Error getting scene info: {str(e)}"
+@_tool_error_handler("getting scene info")
+async def get_scene_info(ctx: Context, sections: list[str] = None) -> str:
+    """
+    Get detailed information about the current Blender scene
+
+    Parameters:
+    - sections: Optional. Only return these parts of the scene info, any of
+      "scene", "selection", "objects", "materials", "world", "collections". Defaults to all of them.
+    """
+    if sections:
+        unknown = set(sections) - SCENE_INFO_SECTIONS
+        if unknown:
+            return f"Error getting scene info: unknown sections {', '.join(sorted(unknown))}"
+        result = _unwrap(await send_scene_read("get_scene_info", {"sections": sections}))
+    else:
+        result = _unwrap(await send_scene_read("get_scene_info"))
+    return _dumps_result(result)
 
 @telemetry_tool("get_object_info")
 @mcp.tool()
-def get_object_info(ctx: Context, object_name: str) -> str:
+@_tool_error_handler("getting object info")
+async def get_object_info(ctx: Context, object_name: str) -> str:
     """
     Get detailed information about a specific object in the Blender scene.
     
     Parameters:
     - object_name: The name of the object to get information about
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_object_info", {"name": object_name})
-        
-        # Just return the JSON representation of what Blender sent us
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting object info from Blender: {str(e)}")
-        return f"Error getting object info: {str(e)}"
+    result = _unwrap(await send_scene_read("get_object_info", {"name": object_name}))
+    
+    # Just return the JSON representation of what Blender sent us
+    return _dumps_result(result)
 
 @telemetry_tool("get_viewport_screenshot")
 @mcp.tool()
-def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
+async def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
     """
     Capture a screenshot of the current Blender 3D viewport.
     
@@ -301,32 +601,19 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
     Returns the screenshot as an Image.
     """
     try:
-        blender = get_blender_connection()
-        
-        # Create temp file path
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_screenshot_{os.getpid()}.png")
-        
-        result = blender.send_command("get_viewport_screenshot", {
+        # Blender sends the PNG back inline, so nothing touches the local filesystem
+        result = _unwrap(await send_blender_command("get_viewport_screenshot", {
             "max_size": max_size,
-            "filepath": temp_path,
             "format": "png"
-        })
-        
+        }))
+
         if "error" in result:
             raise Exception(result["error"])
-        
-        if not os.path.exists(temp_path):
-            raise Exception("Screenshot file was not created")
-        
-        # Read the file
-        with open(temp_path, 'rb') as f:
-            image_bytes = f.read()
-        
-        # Delete the temp file
-        os.remove(temp_path)
-        
-        return Image(data=image_bytes, format="png")
+
+        if "image_b64" not in result:
+            raise Exception("Screenshot data was not returned")
+
+        return Image(data=base64.b64decode(result["image_b64"]), format="png")
         
     except Exception as e:
         logger.error(f"Error capturing screenshot: {str(e)}")
@@ -335,67 +622,54 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
 
 @telemetry_tool("execute_blender_code")
 @mcp.tool()
-def execute_blender_code(ctx: Context, code: str) -> str:
+@_tool_error_handler("executing code")
+async def execute_blender_code(ctx: Context, code: str) -> str:
     """
     Execute arbitrary Python code in Blender. Make sure to do it step-by-step by breaking it into smaller chunks.
 
     Parameters:
     - code: The Python code to execute
     """
-    try:
-        # Get the global connection
-        blender = get_blender_connection()
-        response = blender.send_command("execute_code", {"code": code})
-
-        # Check if Blender returned an error
-        if response.get("status") == "error":
-            error_msg = response.get("message", "Unknown error from Blender")
-            logger.error(f"Blender code execution error: {error_msg}")
-            return f"Error executing code: {error_msg}"
-
-        # Success - return result
-        result = response.get("result", {})
-        return f"Code executed successfully: {result.get('result', '')}"
-    except Exception as e:
-        logger.error(f"Error executing code: {str(e)}")
-        return f"Error executing code: {str(e)}"
+    result = _unwrap(await send_blender_command("execute_code", {"code": code}))
+    return f"Code executed successfully: {result.get('result', '')}"
 
 @telemetry_tool("get_polyhaven_categories")
 @mcp.tool()
-def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
+@_tool_error_handler("getting Polyhaven categories")
+async def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     """
     Get a list of categories for a specific asset type on Polyhaven.
     
     Parameters:
     - asset_type: The type of asset to get categories for (hdris, textures, models, all)
     """
-    try:
-        blender = get_blender_connection()
+    if asset_type not in _POLYHAVEN_QUERY_TYPES:
+        return f"Error: Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"
+    
+    async with get_blender_connection() as blender:
         if not _polyhaven_enabled:
             return "PolyHaven integration is disabled. Select it in the sidebar in BlenderMCP, then run it again."
-        result = blender.send_command("get_polyhaven_categories", {"asset_type": asset_type})
-        
-        if "error" in result:
-            return f"Error: {result['error']}"
-        
-        # Format the categories in a more readable way
-        categories = result["categories"]
-        formatted_output = f"Categories for {asset_type}:\n\n"
-        
-        # Sort categories by count (descending)
-        sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
-        
-        for category, count in sorted_categories:
-            formatted_output += f"- {category}: {count} assets\n"
-        
-        return formatted_output
-    except Exception as e:
-        logger.error(f"Error getting Polyhaven categories: {str(e)}")
-        return f"Error getting Polyhaven categories: {str(e)}"
+        result = _unwrap(await blender.send_command("get_polyhaven_categories", {"asset_type": asset_type}))
+    
+    if "error" in result:
+        return f"Error: {result['error']}"
+    
+    # Format the categories in a more readable way
+    categories = result["categories"]
+    lines = [f"Categories for {asset_type}:", ""]
+    
+    # Sort categories by count (descending)
+    sorted_categories = sorted(categories.items(), key=itemgetter(1), reverse=True)
+    
+    for category, count in sorted_categories:
+        lines.append(f"- {category}: {count} assets")
+    
+    return "\n".join(lines) + "\n"
 
 @telemetry_tool("search_polyhaven_assets")
 @mcp.tool()
-def search_polyhaven_assets(
+@_tool_error_handler("searching Polyhaven assets")
+async def search_polyhaven_assets(
     ctx: Context,
     asset_type: str = "all",
     categories: str = None
@@ -409,43 +683,47 @@ def search_polyhaven_assets(
     
     Returns a list of matching assets with basic information.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("search_polyhaven_assets", {
-            "asset_type": asset_type,
-            "categories": categories
-        })
-        
-        if "error" in result:
-            return f"Error: {result['error']}"
-        
-        # Format the assets in a more readable way
-        assets = result["assets"]
-        total_count = result["total_count"]
-        returned_count = result["returned_count"]
-        
-        formatted_output = f"Found {total_count} assets"
-        if categories:
-            formatted_output += f" in categories: {categories}"
-        formatted_output += f"\nShowing {returned_count} assets:\n\n"
-        
-        # Sort assets by download count (popularity)
-        sorted_assets = sorted(assets.items(), key=lambda x: x[1].get("download_count", 0), reverse=True)
-        
-        for asset_id, asset_data in sorted_assets:
-            formatted_output += f"- {asset_data.get('name', asset_id)} (ID: {asset_id})\n"
-            formatted_output += f"  Type: {['HDRI', 'Texture', 'Model'][asset_data.get('type', 0)]}\n"
-            formatted_output += f"  Categories: {', '.join(asset_data.get('categories', []))}\n"
-            formatted_output += f"  Downloads: {asset_data.get('download_count', 'Unknown')}\n\n"
-        
-        return formatted_output
-    except Exception as e:
-        logger.error(f"Error searching Polyhaven assets: {str(e)}")
-        return f"Error searching Polyhaven assets: {str(e)}"
+    if asset_type and asset_type not in _POLYHAVEN_QUERY_TYPES:
+        return f"Error: Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"
+    
+    result = _unwrap(await send_blender_command("search_polyhaven_assets", {
+        "asset_type": asset_type,
+        "categories": categories
+    }))
+    
+    if "error" in result:
+        return f"Error: {result['error']}"
+    
+    # Format the assets in a more readable way
+    assets = result["assets"]
+    total_count = result["total_count"]
+    returned_count = result["returned_count"]
+    
+    header = f"Found {total_count} assets"
+    if categories:
+        header += f" in categories: {categories}"
+    lines = [header, f"Showing {returned_count} assets:", ""]
+    
+    # Sort assets by download count (popularity), extracting the key once per asset
+    sorted_assets = [
+        (asset_id, asset_data, asset_data.get("download_count", 0) or 0)
+        for asset_id, asset_data in assets.items()
+    ]
+    sorted_assets.sort(key=itemgetter(2), reverse=True)
+    
+    for asset_id, asset_data, _ in sorted_assets:
+        lines.append(f"- {asset_data.get('name', asset_id)} (ID: {asset_id})")
+        lines.append(f"  Type: {_POLYHAVEN_TYPE_LABELS.get(asset_data.get('type', 0), 'Unknown')}")
+        lines.append(f"  Categories: {', '.join(asset_data.get('categories', []))}")
+        lines.append(f"  Downloads: {asset_data.get('download_count', 'Unknown')}")
+        lines.append("")
+    
+    return "\n".join(lines) + "\n"
 
 @telemetry_tool("download_polyhaven_asset")
 @mcp.tool()
-def download_polyhaven_asset(
+@_tool_error_handler("downloading Polyhaven asset")
+async def download_polyhaven_asset(
     ctx: Context,
     asset_id: str,
     asset_type: str,
@@ -463,41 +741,40 @@ def download_polyhaven_asset(
     
     Returns a message indicating success or failure.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("download_polyhaven_asset", {
-            "asset_id": asset_id,
-            "asset_type": asset_type,
-            "resolution": resolution,
-            "file_format": file_format
-        })
-        
-        if "error" in result:
-            return f"Error: {result['error']}"
+    if asset_type not in _POLYHAVEN_ASSET_TYPES:
+        return f"Error: Unsupported asset type: {asset_type}. Must be one of: hdris, textures, models"
+    
+    result = _unwrap(await send_blender_command("download_polyhaven_asset", {
+        "asset_id": asset_id,
+        "asset_type": asset_type,
+        "resolution": resolution,
+        "file_format": file_format
+    }))
+    
+    if "error" in result:
+        return f"Error: {result['error']}"
+    
+    if result.get("success"):
+        message = result.get("message", "Asset downloaded and imported successfully")
         
-        if result.get("success"):
-            message = result.get("message", "Asset downloaded and imported successfully")
-            
-            # Add additional information based on asset type
-            if asset_type == "hdris":
-                return f"{message}. The HDRI has been set as the world environment."
-            elif asset_type == "textures":
-                material_name = result.get("material", "")
-                maps = ", ".join(result.get("maps", []))
-                return f"{message}. Created material '{material_name}' with maps: {maps}."
-            elif asset_type == "models":
-                return f"{message}. The model has been imported into the current scene."
-            else:
-                return message
+        # Add additional information based on asset type
+        if asset_type == "hdris":
+            return f"{message}. The HDRI has been set as the world environment."
+        elif asset_type == "textures":
+            material_name = result.get("material", "")
+            maps = ", ".join(result.get("maps", []))
+            return f"{message}. Created material '{material_name}' with maps: {maps}."
+        elif asset_type == "models":
+            return f"{message}. The model has been imported into the current scene."
         else:
-            return f"Failed to download asset: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error downloading Polyhaven asset: {str(e)}")
-        return f"Error downloading Polyhaven asset: {str(e)}"
+            return message
+    else:
+        return f"Failed to download asset: {result.get('message', 'Unknown error')}"
 
 @telemetry_tool("set_texture")
 @mcp.tool()
-def set_texture(
+@_tool_error_handler("applying texture")
+async def set_texture(
     ctx: Context,
     object_name: str,
     texture_id: str
@@ -511,112 +788,101 @@ def set_texture(
     
     Returns a message indicating success or failure.
     """
-    try:
-        # Get the global connection
-        blender = get_blender_connection()
-        result = blender.send_command("set_texture", {
-            "object_name": object_name,
-            "texture_id": texture_id
-        })
+    result = _unwrap(await send_blender_command("set_texture", {
+        "object_name": object_name,
+        "texture_id": texture_id
+    }))
+    
+    if "error" in result:
+        return f"Error: {result['error']}"
+    
+    if result.get("success"):
+        material_name = result.get("material", "")
+        maps = ", ".join(result.get("maps", []))
         
-        if "error" in result:
-            return f"Error: {result['error']}"
+        # Add detailed material info
+        material_info = result.get("material_info", {})
+        node_count = material_info.get("node_count", 0)
+        has_nodes = material_info.get("has_nodes", False)
+        texture_nodes = material_info.get("texture_nodes", [])
         
-        if result.get("success"):
-            material_name = result.get("material", "")
-            maps = ", ".join(result.get("maps", []))
-            
-            # Add detailed material info
-            material_info = result.get("material_info", {})
-            node_count = material_info.get("node_count", 0)
-            has_nodes = material_info.get("has_nodes", False)
-            texture_nodes = material_info.get("texture_nodes", [])
-            
-            output = f"Successfully applied texture '{texture_id}' to {object_name}.\n"
-            output += f"Using material '{material_name}' with maps: {maps}.\n\n"
-            output += f"Material has nodes: {has_nodes}\n"
-            output += f"Total node count: {node_count}\n\n"
-            
-            if texture_nodes:
-                output += "Texture nodes:\n"
-                for node in texture_nodes:
-                    output += f"- {node['name']} using image: {node['image']}\n"
-                    if node['connections']:
-                        output += "  Connections:\n"
-                        for conn in node['connections']:
-                            output += f"    {conn}\n"
-            else:
-                output += "No texture nodes found in the material.\n"
-            
-            return output
+        lines = [
+            f"Successfully applied texture '{texture_id}' to {object_name}.",
+            f"Using material '{material_name}' with maps: {maps}.",
+            "",
+            f"Material has nodes: {has_nodes}",
+            f"Total node count: {node_count}",
+            "",
+        ]
+        
+        if texture_nodes:
+            lines.append("Texture nodes:")
+            for node in texture_nodes:
+                lines.append(f"- {node['name']} using image: {node['image']}")
+                if node['connections']:
+                    lines.append("  Connections:")
+                    lines.extend(f"    {conn}" for conn in node['connections'])
         else:
-            return f"Failed to apply texture: {result.get('message', 'Unknown error')}"
+            lines.append("No texture nodes found in the material.")
+        
+        return "\n".join(lines) + "\n"
+    else:
+        return f"Failed to apply texture: {result.get('message', 'Unknown error')}"
+
+async def _get_integration_status(command: str, label: str, banner: str = "") -> str:
+    """Relay an integration status message from Blender, appending banner when it is enabled"""
+    try:
+        result = _unwrap(await send_blender_command(command))
+        if command == "get_polyhaven_status":
+            # Keep the cached flag in step, the user may have just toggled PolyHaven in the sidebar
+            _store_polyhaven_status(result)
+        message = result.get("message", "")
+        if banner and result.get("enabled", False):
+            message += banner
+        return message
     except Exception as e:
-        logger.error(f"Error applying texture: {str(e)}")
-        return f"Error applying texture: {str(e)}"
+        logger.error(f"Error checking {label} status: {str(e)}")
+        return f"Error checking {label} status: {str(e)}"
 
 @telemetry_tool("get_polyhaven_status")
 @mcp.tool()
-def get_polyhaven_status(ctx: Context) -> str:
+async def get_polyhaven_status(ctx: Context) -> str:
     """
     Check if PolyHaven integration is enabled in Blender.
     Returns a message indicating whether PolyHaven features are available.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_polyhaven_status")
-        enabled = result.get("enabled", False)
-        message = result.get("message", "")
-        if enabled:
-            message += "PolyHaven is good at Textures, and has a wider variety of textures than Sketchfab."
-        return message
-    except Exception as e:
-        logger.error(f"Error checking PolyHaven status: {str(e)}")
-        return f"Error checking PolyHaven status: {str(e)}"
+    return await _get_integration_status(
+        "get_polyhaven_status", "PolyHaven",
+        "PolyHaven is good at Textures, and has a wider variety of textures than Sketchfab."
+    )
 
 @telemetry_tool("get_hyper3d_status")
 @mcp.tool()
-def get_hyper3d_status(ctx: Context) -> str:
+async def get_hyper3d_status(ctx: Context) -> str:
     """
     Check if Hyper3D Rodin integration is enabled in Blender.
     Returns a message indicating whether Hyper3D Rodin features are available.
 
     Don't emphasize the key type in the returned message, but sliently remember it. 
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_hyper3d_status")
-        enabled = result.get("enabled", False)
-        message = result.get("message", "")
-        if enabled:
-            message += ""
-        return message
-    except Exception as e:
-        logger.error(f"Error checking Hyper3D status: {str(e)}")
-        return f"Error checking Hyper3D status: {str(e)}"
+    return await _get_integration_status("get_hyper3d_status", "Hyper3D")
 
 @telemetry_tool("get_sketchfab_status")
 @mcp.tool()
-def get_sketchfab_status(ctx: Context) -> str:
+async def get_sketchfab_status(ctx: Context) -> str:
     """
     Check if Sketchfab integration is enabled in Blender.
     Returns a message indicating whether Sketchfab features are available.
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_sketchfab_status")
-        enabled = result.get("enabled", False)
-        message = result.get("message", "")
-        if enabled:
-            message += "Sketchfab is good at Realistic models, and has a wider variety of models than PolyHaven."        
-        return message
-    except Exception as e:
-        logger.error(f"Error checking Sketchfab status: {str(e)}")
-        return f"Error checking Sketchfab status: {str(e)}"
+    return await _get_integration_status(
+        "get_sketchfab_status", "Sketchfab",
+        "Sketchfab is good at Realistic models, and has a wider variety of models than PolyHaven."
+    )
 
 @telemetry_tool("search_sketchfab_models")
 @mcp.tool()
-def search_sketchfab_models(
+@_tool_error_handler("searching Sketchfab models")
+async def search_sketchfab_models(
     ctx: Context,
     query: str,
     categories: str = None,
@@ -634,66 +900,61 @@ def search_sketchfab_models(
 
     Returns a formatted list of matching models.
     """
-    try:
-        blender = get_blender_connection()
-        logger.info(f"Searching Sketchfab models with query: {query}, categories: {categories}, count: {count}, downloadable: {downloadable}")
-        result = blender.send_command("search_sketchfab_models", {
-            "query": query,
-            "categories": categories,
-            "count": count,
-            "downloadable": downloadable
-        })
+    logger.info(f"Searching Sketchfab models with query: {query}, categories: {categories}, count: {count}, downloadable: {downloadable}")
+    result = _unwrap(await send_blender_command("search_sketchfab_models", {
+        "query": query,
+        "categories": categories,
+        "count": count,
+        "downloadable": downloadable
+    }))
+    
+    if "error" in result:
+        logger.error(f"Error from Sketchfab search: {result['error']}")
+        return f"Error: {result['error']}"
+    
+    # Safely get results with fallbacks for None
+    if result is None:
+        logger.error("Received None result from Sketchfab search")
+        return "Error: Received no response from Sketchfab search"
         
-        if "error" in result:
-            logger.error(f"Error from Sketchfab search: {result['error']}")
-            return f"Error: {result['error']}"
+    # Format the results
+    models = result.get("results", []) or []
+    if not models:
+        return f"No models found matching '{query}'"
         
-        # Safely get results with fallbacks for None
-        if result is None:
-            logger.error("Received None result from Sketchfab search")
-            return "Error: Received no response from Sketchfab search"
-            
-        # Format the results
-        models = result.get("results", []) or []
-        if not models:
-            return f"No models found matching '{query}'"
+    lines = [f"Found {len(models)} models matching '{query}':", ""]
+    
+    for model in models:
+        if model is None:
+            continue
             
-        formatted_output = f"Found {len(models)} models matching '{query}':\n\n"
+        model_name = model.get("name", "Unnamed model")
+        model_uid = model.get("uid", "Unknown ID")
+        lines.append(f"- {model_name} (UID: {model_uid})")
         
-        for model in models:
-            if model is None:
-                continue
-                
-            model_name = model.get("name", "Unnamed model")
-            model_uid = model.get("uid", "Unknown ID")
-            formatted_output += f"- {model_name} (UID: {model_uid})\n"
-            
-            # Get user info with safety checks
-            user = model.get("user") or {}
-            username = user.get("username", "Unknown author") if isinstance(user, dict) else "Unknown author"
-            formatted_output += f"  Author: {username}\n"
-            
-            # Get license info with safety checks
-            license_data = model.get("license") or {}
-            license_label = license_data.get("label", "Unknown") if isinstance(license_data, dict) else "Unknown"
-            formatted_output += f"  License: {license_label}\n"
-            
-            # Add face count and downloadable status
-            face_count = model.get("faceCount", "Unknown")
-            is_downloadable = "Yes" if model.get("isDownloadable") else "No"
-            formatted_output += f"  Face count: {face_count}\n"
-            formatted_output += f"  Downloadable: {is_downloadable}\n\n"
+        # Get user info with safety checks
+        user = model.get("user") or {}
+        username = user.get("username", "Unknown author") if isinstance(user, dict) else "Unknown author"
+        lines.append(f"  Author: {username}")
         
-        return formatted_output
-    except Exception as e:
-        logger.error(f"Error searching Sketchfab models: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return f"Error searching Sketchfab models: {str(e)}"
+        # Get license info with safety checks
+        license_data = model.get("license") or {}
+        license_label = license_data.get("label", "Unknown") if isinstance(license_data, dict) else "Unknown"
+        lines.append(f"  License: {license_label}")
+        
+        # Add face count and downloadable status
+        face_count = model.get("faceCount", "Unknown")
+        is_downloadable = "Yes" if model.get("isDownloadable") else "No"
+        lines.append(f"  Face count: {face_count}")
+        lines.append(f"  Downloadable: {is_downloadable}")
+        lines.append("")
+    
+    return "\n".join(lines) + "\n"
 
 @telemetry_tool("download_sketchfab_model")
 @mcp.tool()
-def download_sketchfab_model(
+@_tool_error_handler("downloading Sketchfab model")
+async def download_sketchfab_model(
     ctx: Context,
     uid: str
 ) -> str:
@@ -706,50 +967,76 @@ def download_sketchfab_model(
     Returns a message indicating success or failure.
     The model must be downloadable and you must have proper access rights.
     """
-    try:
-        
-        blender = get_blender_connection()
-        logger.info(f"Attempting to download Sketchfab model with UID: {uid}")
-        
-        result = blender.send_command("download_sketchfab_model", {
-            "uid": uid
-        })
-        
-        if result is None:
-            logger.error("Received None result from Sketchfab download")
-            return "Error: Received no response from Sketchfab download request"
-            
-        if "error" in result:
-            logger.error(f"Error from Sketchfab download: {result['error']}")
-            return f"Error: {result['error']}"
+    
+    logger.info(f"Attempting to download Sketchfab model with UID: {uid}")
+    
+    result = _unwrap(await send_blender_command("download_sketchfab_model", {
+        "uid": uid
+    }))
+    
+    if result is None:
+        logger.error("Received None result from Sketchfab download")
+        return "Error: Received no response from Sketchfab download request"
         
-        if result.get("success"):
-            imported_objects = result.get("imported_objects", [])
-            object_names = ", ".join(imported_objects) if imported_objects else "none"
-            return f"Successfully imported model. Created objects: {object_names}"
-        else:
-            return f"Failed to download model: {result.get('message', 'Unknown error')}"
-    except Exception as e:
-        logger.error(f"Error downloading Sketchfab model: {str(e)}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return f"Error downloading Sketchfab model: {str(e)}"
+    if "error" in result:
+        logger.error(f"Error from Sketchfab download: {result['error']}")
+        return f"Error: {result['error']}"
+    
+    if result.get("success"):
+        imported_objects = result.get("imported_objects", [])
+        object_names = ", ".join(imported_objects) if imported_objects else "none"
+        return f"Successfully imported model. Created objects: {object_names}"
+    else:
+        return f"Failed to download model: {result.get('message', 'Unknown error')}"
 
 def _process_bbox(original_bbox: list[float] | list[int] | None) -> list[int] | None:
     if original_bbox is None:
         return None
-    if all(isinstance(i, int) for i in original_bbox):
-        return original_bbox
-    if any(i<=0 for i in original_bbox):
-        raise ValueError("Incorrect number range: bbox must be bigger than zero!")
-    return [int(float(i) / max(original_bbox) * 100) for i in original_bbox] if original_bbox else None
+    # Validate, detect all-int input and find the max in a single pass
+    largest = 0
+    all_int = True
+    for i in original_bbox:
+        if i <= 0:
+            raise ValueError("Incorrect number range: bbox must be bigger than zero!")
+        if not isinstance(i, int):
+            all_int = False
+        if i > largest:
+            largest = i
+    if all_int:
+        return list(original_bbox)
+    largest = float(largest)
+    return [int(float(i) / largest * 100) for i in original_bbox]
+
+def _load_image(path: str, size: int) -> tuple[str, str]:
+    """Read an image file of a known size and return its suffix and base64-encoded contents"""
+    suffix = os.path.splitext(path)[1]
+    # mmap can't map an empty file
+    if size == 0:
+        return suffix, ""
+    # Encode straight from the page cache instead of copying the file into a Python buffer first
+    with open(path, "rb", buffering=0) as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        return suffix, _b64encode(mm)
+
+def _extract_rodin_job(result: Dict[str, Any]) -> Dict[str, str] | None:
+    """Pull the task ids out of a Rodin job submission, or None if it failed"""
+    # The addon reports some failures as a plain string
+    if not isinstance(result, dict) or not result.get("submit_time", False):
+        return None
+    return {
+        "task_uuid": result["uuid"],
+        "subscription_key": result["jobs"]["subscription_key"],
+    }
 
 @telemetry_tool("generate_hyper3d_model_via_text")
 @mcp.tool()
-def generate_hyper3d_model_via_text(
+@_tool_error_handler("generating Hyper3D task")
+async def generate_hyper3d_model_via_text(
     ctx: Context,
     text_prompt: str,
-    bbox_condition: list[float]=None
+    bbox_condition: list[float]=None,
+    force_new: bool=False
 ) -> str:
     """
     Generate 3D asset using Hyper3D by giving description of the desired asset, and import the asset into Blender.
@@ -759,35 +1046,32 @@ def generate_hyper3d_model_via_text(
     Parameters:
     - text_prompt: A short description of the desired model in **English**.
     - bbox_condition: Optional. If given, it has to be a list of floats of length 3. Controls the ratio between [Length, Width, Height] of the model.
+    - force_new: Optional. Set to true to start a new generation even if an identical request was made recently.
 
+    An identical request made recently returns the job it already created instead of starting
+    a new one, unless that job failed or force_new is set.
     Returns a message indicating success or failure.
     """
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_rodin_job", {
-            "text_prompt": text_prompt,
-            "images": None,
-            "bbox_condition": _process_bbox(bbox_condition),
-        })
-        succeed = result.get("submit_time", False)
-        if succeed:
-            return json.dumps({
-                "task_uuid": result["uuid"],
-                "subscription_key": result["jobs"]["subscription_key"],
-            })
-        else:
-            return json.dumps(result)
-    except Exception as e:
-        logger.error(f"Error generating Hyper3D task: {str(e)}")
+        bbox = _process_bbox(bbox_condition)
+    except ValueError as e:
+        # Bad input, not a server fault, so report it without a traceback
         return f"Error generating Hyper3D task: {str(e)}"
+    return _dumps_result(await submit_generation_job("create_rodin_job", {
+        "text_prompt": text_prompt,
+        "images": None,
+        "bbox_condition": bbox,
+    }, _extract_rodin_job, force_new))
 
 @telemetry_tool("generate_hyper3d_model_via_images")
 @mcp.tool()
-def generate_hyper3d_model_via_images(
+@_tool_error_handler("generating Hyper3D task")
+async def generate_hyper3d_model_via_images(
     ctx: Context,
     input_image_paths: list[str]=None,
     input_image_urls: list[str]=None,
-    bbox_condition: list[float]=None
+    bbox_condition: list[float]=None,
+    force_new: bool=False
 ) -> str:
     """
     Generate 3D asset using Hyper3D by giving images of the wanted asset, and import the generated asset into Blender.
@@ -798,49 +1082,57 @@ def generate_hyper3d_model_via_images(
     - input_image_paths: The **absolute** paths of input images. Even if only one image is provided, wrap it into a list. Required if Hyper3D Rodin in MAIN_SITE mode.
     - input_image_urls: The URLs of input images. Even if only one image is provided, wrap it into a list. Required if Hyper3D Rodin in FAL_AI mode.
     - bbox_condition: Optional. If given, it has to be a list of ints of length 3. Controls the ratio between [Length, Width, Height] of the model.
+    - force_new: Optional. Set to true to start a new generation even if an identical request was made recently.
 
     Only one of {input_image_paths, input_image_urls} should be given at a time, depending on the Hyper3D Rodin's current mode.
+    An identical request made recently returns the job it already created instead of starting
+    a new one, unless that job failed or force_new is set.
     Returns a message indicating success or failure.
     """
     if input_image_paths is not None and input_image_urls is not None:
         return f"Error: Conflict parameters given!"
     if input_image_paths is None and input_image_urls is None:
         return f"Error: No image given!"
+    try:
+        bbox = _process_bbox(bbox_condition)
+    except ValueError as e:
+        # Bad input, not a server fault, so report it without a traceback
+        return f"Error generating Hyper3D task: {str(e)}"
     if input_image_paths is not None:
-        if not all(os.path.exists(i) for i in input_image_paths):
-            return "Error: not all image paths are valid!"
-        images = []
+        # One stat per image both validates the path and gives the read size
+        sizes = []
         for path in input_image_paths:
-            with open(path, "rb") as f:
-                images.append(
-                    (Path(path).suffix, base64.b64encode(f.read()).decode("ascii"))
-                )
+            try:
+                sizes.append(os.stat(path).st_size)
+            except (OSError, ValueError):
+                return "Error: not all image paths are valid!"
+        # File reads and the encode both release the GIL, so load the images in parallel
+        # on worker threads and keep the event loop free for other tool calls
+        loop = asyncio.get_running_loop()
+        images = list(await asyncio.gather(*(
+            loop.run_in_executor(_image_executor, _load_image, path, size)
+            for path, size in zip(input_image_paths, sizes)
+        )))
     elif input_image_urls is not None:
-        if not all(urlparse(i) for i in input_image_paths):
+        # Validate every URL in one regex pass over a newline-joined buffer,
+        # rejecting URLs that contain a newline themselves so the line count stays exact
+        joined = "\n".join(input_image_urls)
+        if input_image_urls and (
+            joined.count("\n") != len(input_image_urls) - 1
+            or len(_URL_RE.findall(joined)) != len(input_image_urls)
+        ):
             return "Error: not all image URLs are valid!"
         images = input_image_urls.copy()
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_rodin_job", {
-            "text_prompt": None,
-            "images": images,
-            "bbox_condition": _process_bbox(bbox_condition),
-        })
-        succeed = result.get("submit_time", False)
-        if succeed:
-            return json.dumps({
-                "task_uuid": result["uuid"],
-                "subscription_key": result["jobs"]["subscription_key"],
-            })
-        else:
-            return json.dumps(result)
-    except Exception as e:
-        logger.error(f"Error generating Hyper3D task: {str(e)}")
-        return f"Error generating Hyper3D task: {str(e)}"
+    return _dumps_result(await submit_generation_job("create_rodin_job", {
+        "text_prompt": None,
+        "images": images,
+        "bbox_condition": bbox,
+    }, _extract_rodin_job, force_new))
 
 @telemetry_tool("poll_rodin_job_status")
 @mcp.tool()
-def poll_rodin_job_status(
+@_tool_error_handler("generating Hyper3D task")
+async def poll_rodin_job_status(
     ctx: Context,
     subscription_key: str=None,
     request_id: str=None,
@@ -865,26 +1157,27 @@ def poll_rodin_job_status(
         If status other than "COMPLETED", "IN_PROGRESS", "IN_QUEUE" showed up, the generating process might be failed.
         This is a polling API, so only proceed if the status are finally determined ("COMPLETED" or some failed state).
     """
-    try:
-        blender = get_blender_connection()
-        kwargs = {}
-        if subscription_key:
-            kwargs = {
-                "subscription_key": subscription_key,
-            }
-        elif request_id:
-            kwargs = {
-                "request_id": request_id,
-            }
-        result = blender.send_command("poll_rodin_job_status", kwargs)
-        return result
-    except Exception as e:
-        logger.error(f"Error generating Hyper3D task: {str(e)}")
-        return f"Error generating Hyper3D task: {str(e)}"
+    kwargs = {}
+    if subscription_key:
+        kwargs = {
+            "subscription_key": subscription_key,
+        }
+    elif request_id:
+        kwargs = {
+            "request_id": request_id,
+        }
+    result = _unwrap(await send_coalesced_poll("poll_rodin_job_status", kwargs))
+    # A failed job must not be handed out again for an identical generate request
+    if subscription_key and isinstance(result, dict) and any(
+        status in ("Failed", "Canceled") for status in result.get("status_list", ())
+    ):
+        forget_generation_job("subscription_key", subscription_key)
+    return result
 
 @telemetry_tool("import_generated_asset")
 @mcp.tool()
-def import_generated_asset(
+@_tool_error_handler("generating Hyper3D task")
+async def import_generated_asset(
     ctx: Context,
     name: str,
     task_uuid: str=None,
@@ -901,43 +1194,42 @@ def import_generated_asset(
     Only give one of {task_uuid, request_id} based on the Hyper3D Rodin Mode!
     Return if the asset has been imported successfully.
     """
-    try:
-        blender = get_blender_connection()
-        kwargs = {
-            "name": name
-        }
-        if task_uuid:
-            kwargs["task_uuid"] = task_uuid
-        elif request_id:
-            kwargs["request_id"] = request_id
-        result = blender.send_command("import_generated_asset", kwargs)
-        return result
-    except Exception as e:
-        logger.error(f"Error generating Hyper3D task: {str(e)}")
-        return f"Error generating Hyper3D task: {str(e)}"
+    kwargs = {
+        "name": name
+    }
+    if task_uuid:
+        kwargs["task_uuid"] = task_uuid
+    elif request_id:
+        kwargs["request_id"] = request_id
+    result = _unwrap(await send_blender_command("import_generated_asset", kwargs))
+    return result
 
 @mcp.tool()
-def get_hunyuan3d_status(ctx: Context) -> str:
+async def get_hunyuan3d_status(ctx: Context) -> str:
     """
     Check if Hunyuan3D integration is enabled in Blender.
     Returns a message indicating whether Hunyuan3D features are available.
 
     Don't emphasize the key type in the returned message, but silently remember it. 
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("get_hunyuan3d_status")
-        message = result.get("message", "")
-        return message
-    except Exception as e:
-        logger.error(f"Error checking Hunyuan3D status: {str(e)}")
-        return f"Error checking Hunyuan3D status: {str(e)}"
+    return await _get_integration_status("get_hunyuan3d_status", "Hunyuan3D")
     
+def _extract_hunyuan_job(result: Dict[str, Any]) -> Dict[str, str] | None:
+    """Pull the job id out of a Hunyuan3D job submission, or None if it failed"""
+    # The addon reports some failures as a plain string
+    if not isinstance(result, dict) or "JobId" not in result.get("Response", {}):
+        return None
+    return {
+        "job_id": f"job_{result['Response']['JobId']}",
+    }
+
 @mcp.tool()
-def generate_hunyuan3d_model(
+@_tool_error_handler("generating Hunyuan3D task")
+async def generate_hunyuan3d_model(
     ctx: Context,
     text_prompt: str = None,
-    input_image_url: str = None
+    input_image_url: str = None,
+    force_new: bool = False
 ) -> str:
     """
     Generate 3D asset using Hunyuan3D by providing either text description, image reference, 
@@ -947,31 +1239,24 @@ def generate_hunyuan3d_model(
     Parameters:
     - text_prompt: (Optional) A short description of the desired model in English/Chinese.
     - input_image_url: (Optional) The local or remote url of the input image. Accepts None if only using text prompt.
+    - force_new: (Optional) Set to true to start a new generation even if an identical request was made recently.
+
+    An identical request made recently returns the job it already created instead of starting
+    a new one, unless that job failed or force_new is set.
 
     Returns: 
     - When successful, returns a JSON with job_id (format: "job_xxx") indicating the task is in progress
     - When the job completes, the status will change to "DONE" indicating the model has been imported
     - Returns error message if the operation fails
     """
-    try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_hunyuan_job", {
-            "text_prompt": text_prompt,
-            "image": input_image_url,
-        })
-        if "JobId" in result.get("Response", {}):
-            job_id = result["Response"]["JobId"]
-            formatted_job_id = f"job_{job_id}"
-            return json.dumps({
-                "job_id": formatted_job_id,
-            })
-        return json.dumps(result)
-    except Exception as e:
-        logger.error(f"Error generating Hunyuan3D task: {str(e)}")
-        return f"Error generating Hunyuan3D task: {str(e)}"
+    return _dumps_result(await submit_generation_job("create_hunyuan_job", {
+        "text_prompt": text_prompt,
+        "image": input_image_url,
+    }, _extract_hunyuan_job, force_new))
     
 @mcp.tool()
-def poll_hunyuan_job_status(
+@_tool_error_handler("generating Hunyuan3D task")
+async def poll_hunyuan_job_status(
     ctx: Context,
     job_id: str=None,
 ):
@@ -988,19 +1273,18 @@ def poll_hunyuan_job_status(
         When the status is "DONE", the response includes a field named ResultFile3Ds that contains the generated ZIP file path of the 3D model in OBJ format.
         This is a polling API, so only proceed if the status are finally determined ("DONE" or some failed state).
     """
-    try:
-        blender = get_blender_connection()
-        kwargs = {
-            "job_id": job_id,
-        }
-        result = blender.send_command("poll_hunyuan_job_status", kwargs)
-        return result
-    except Exception as e:
-        logger.error(f"Error generating Hunyuan3D task: {str(e)}")
-        return f"Error generating Hunyuan3D task: {str(e)}"
+    kwargs = {
+        "job_id": job_id,
+    }
+    result = _unwrap(await send_coalesced_poll("poll_hunyuan_job_status", kwargs))
+    # A failed job must not be handed out again for an identical generate request
+    if isinstance(result, dict) and result.get("Response", {}).get("Status") == "FAIL":
+        forget_generation_job("job_id", job_id)
+    return result
 
 @mcp.tool()
-def import_generated_asset_hunyuan(
+@_tool_error_handler("generating Hunyuan3D task")
+async def import_generated_asset_hunyuan(
     ctx: Context,
     name: str,
     zip_file_url: str,
@@ -1014,24 +1298,17 @@ def import_generated_asset_hunyuan(
 
     Return if the asset has been imported successfully.
     """
-    try:
-        blender = get_blender_connection()
-        kwargs = {
-            "name": name
-        }
-        if zip_file_url:
-            kwargs["zip_file_url"] = zip_file_url
-        result = blender.send_command("import_generated_asset_hunyuan", kwargs)
-        return result
-    except Exception as e:
-        logger.error(f"Error generating Hunyuan3D task: {str(e)}")
-        return f"Error generating Hunyuan3D task: {str(e)}"
+    kwargs = {
+        "name": name
+    }
+    if zip_file_url:
+        kwargs["zip_file_url"] = zip_file_url
+    result = _unwrap(await send_blender_command("import_generated_asset_hunyuan", kwargs))
+    return result
 
 
-@mcp.prompt()
-def asset_creation_strategy() -> str:
-    """Defines the preferred strategy for creating assets in Blender"""
-    return """When creating 3D content in Blender, always start by checking if integrations are available:
+# Prompt text for asset_creation_strategy, built once at import
+_ASSET_STRATEGY = """When creating 3D content in Blender, always start by checking if integrations are available:
 
     0. Before anything, always check the scene from get_scene_info()
     1. First use the following tools to verify if the following integrations are enabled:
@@ -1118,6 +1395,11 @@ def asset_creation_strategy() -> str:
     - The task specifically requires a basic material/color
     """
 
+@mcp.prompt()
+def asset_creation_strategy() -> str:
+    """Defines the preferred strategy for creating assets in Blender"""
+    return _ASSET_STRATEGY
+
 # Main execution
 
 def main():